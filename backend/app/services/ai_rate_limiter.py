@@ -61,8 +61,9 @@ class AIRateLimiter:
         """
         # Check daily game limit
         today = datetime.now().date().isoformat()
-        if len(self._daily_games[today]) >= self.daily_game_limit:
-            if game_id not in self._daily_games[today]:
+        daily_games = self._daily_games[today]
+        if len(daily_games) >= self.daily_game_limit:
+            if game_id not in daily_games:
                 error_msg = (
                     f"Daily AI game limit reached ({self.daily_game_limit} games). "
                     "Falling back to template responses."
@@ -93,7 +94,7 @@ class AIRateLimiter:
         # All checks passed - increment counters
         self._move_calls[game_id][move_number] += 1
         self._game_calls[game_id] += 1
-        self._daily_games[today].add(game_id)
+        daily_games.add(game_id)
 
         logger.debug(
             "AI call allowed - game=%s, move=%s, endpoint=%s, "
@@ -119,8 +120,6 @@ class AIRateLimiter:
         Returns:
             Dict with usage statistics
         """
-        today = datetime.now().date().isoformat()
-
         if game_id:
             # Game-specific stats
             return {
@@ -134,12 +133,12 @@ class AIRateLimiter:
             }
 
         # Global stats
+        today = datetime.now().date().isoformat()
+        daily_games_today = len(self._daily_games.get(today, ()))
         return {
-            "daily_games_today": len(self._daily_games[today]),
+            "daily_games_today": daily_games_today,
             "daily_game_limit": self.daily_game_limit,
-            "remaining_daily_games": max(
-                0, self.daily_game_limit - len(self._daily_games[today])
-            ),
+            "remaining_daily_games": max(0, self.daily_game_limit - daily_games_today),
             "total_active_games": len(self._game_calls),
             "limits": {
                 "max_calls_per_move": self.max_calls_per_move,
@@ -161,6 +160,17 @@ class AIRateLimiter:
         self._game_calls.pop(game_id, None)
         logger.info("Reset AI rate limits for game %s", game_id[:8])
 
+    def reset_all(self) -> None:
+        """
+        Reset all rate limit counters, including daily game tracking.
+
+        Useful when limits are reloaded or a limiter instance is reused.
+        """
+        self._move_calls.clear()
+        self._game_calls.clear()
+        self._daily_games.clear()
+        logger.debug("Reset all AI rate limits")
+
     def cleanup_old_data(self, days_to_keep: int = 7):
         """
         Remove old daily game data to prevent memory leaks.
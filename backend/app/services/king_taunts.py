@@ -66,6 +66,10 @@ TAUNTS: dict[str, list[str]] = {
     ],
 }
 
+# Bound once at import; generate_taunt runs on every qualifying move
+_taunts_get = TAUNTS.get
+_choose_taunt = random.choice
+
 
 class KingTauntGenerator:
     """Generate contextual taunts from the opponent's King."""
@@ -88,31 +92,24 @@ class KingTauntGenerator:
         Returns:
             Taunt text or None if no taunt is appropriate.
         """
-        # Determine the best taunt category
-        category = trigger_event
+        templates = _taunts_get(trigger_event)
 
         # If there's no direct match, infer from game state
-        if category not in TAUNTS:
+        if templates is None:
             if material_balance > 3:
-                category = "winning"
+                templates = _taunts_get("winning")
             elif material_balance < -3:
-                category = "losing"
+                templates = _taunts_get("losing")
             else:
                 return None  # No taunt for neutral states
 
-        templates = TAUNTS.get(category, [])
         if not templates:
             return None
 
-        taunt = random.choice(templates)
-
         # Fill in template variables
-        if piece_type:
-            taunt = taunt.replace("{piece}", piece_type.capitalize())
-        else:
-            taunt = taunt.replace("{piece}", "piece")
-
-        return taunt
+        return _choose_taunt(templates).replace(
+            "{piece}", piece_type.capitalize() if piece_type else "piece"
+        )
 
     @staticmethod
     def should_taunt(trigger_event: str, move_count: int) -> bool:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import random
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -99,8 +100,6 @@ class MoraleCalculator:
         Based on morale level, risk of the move, and piece personality.
         Pieces with very high morale (90+) almost always obey.
         """
-        import random
-
         base_rate = MoraleCalculator.get_obedience_rate(morale)
 
         # Risk adjustment
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import logging
 import random
+from bisect import bisect_right
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -17,27 +20,191 @@ BASE_RATES = {
     (0, 19): 0.10,
 }
 
+# BASE_RATES as ((low, high), rate) pairs, highest morale band first
+BASE_RATES_ORDERED: tuple[tuple[tuple[int, int], float], ...] = tuple(
+    sorted(BASE_RATES.items(), key=lambda item: item[0][0], reverse=True)
+)
+
 # Personality keywords that resonate with each piece type
-PERSONALITY_KEYWORDS: dict[str, list[str]] = {
-    "pawn": ["team", "sacrifice", "together", "duty", "greater good", "promotion", "advance"],
-    "knight": ["glory", "brave", "heroic", "adventure", "charge", "honor", "flashy"],
-    "bishop": ["logic", "tactical", "strategy", "position", "calculated", "smart", "reason"],
-    "rook": ["duty", "order", "discipline", "defend", "hold", "strong", "fortress"],
-    "queen": ["power", "protect", "important", "safe", "retreat", "value", "worth"],
-    "king": ["survive", "protect", "castle", "safety", "kingdom", "careful"],
+PERSONALITY_KEYWORDS: dict[str, frozenset[str]] = {
+    "pawn": frozenset(
+        {"team", "sacrifice", "together", "duty", "greater good", "promotion", "advance"}
+    ),
+    "knight": frozenset({"glory", "brave", "heroic", "adventure", "charge", "honor", "flashy"}),
+    "bishop": frozenset(
+        {"logic", "tactical", "strategy", "position", "calculated", "smart", "reason"}
+    ),
+    "rook": frozenset({"duty", "order", "discipline", "defend", "hold", "strong", "fortress"}),
+    "queen": frozenset({"power", "protect", "important", "safe", "retreat", "value", "worth"}),
+    "king": frozenset({"survive", "protect", "castle", "safety", "kingdom", "careful"}),
 }
 
 
+def _scan_base_rate(morale: int) -> float:
+    for (low, high), rate in BASE_RATES_ORDERED:
+        if low <= morale <= high:
+            return rate
+    return 0.45
+
+
+def _scan_morale_modifier(morale: int) -> int:
+    if morale >= 80:
+        return 20
+    elif morale >= 60:
+        return 10
+    elif morale >= 40:
+        return 0
+    elif morale >= 20:
+        return -10
+    return -20
+
+
+# Per-morale (0-100) lookup tables, built once so hot-path calls are a single index
+_BASE_RATE_TABLE: tuple[float, ...] = tuple(_scan_base_rate(m) for m in range(101))
+_MORALE_MOD_TABLE: tuple[int, ...] = tuple(_scan_morale_modifier(m) for m in range(101))
+
+# Trust history cut points and the modifier for each band between them
+_TRUST_CUTS = (0.2, 0.4, 0.6, 0.8)
+_TRUST_MODS = (-15, -8, 0, 5, 10)
+
+# Words that count as acknowledging a risky move
+_RISK_WORDS = ("risky", "dangerous", "sacrifice", "trade")
+
+# Uniform [0, 1) source for the success roll, bound once at import
+_rng_next = random.random
+
+
+# Scalar scoring kernels: ints/bools in, int out, no string work
+
+
+def _logic_score_impl(word_count: int, is_claim_accurate: bool, acknowledges_risk: bool) -> int:
+    # Base score of 5, plus 10 for accurate claims or minus 5 for inaccurate ones
+    score = 15 if is_claim_accurate else 0
+
+    # Argument length/detail bonus (longer = more effort)
+    if word_count >= 10:
+        score += 5
+    elif word_count >= 5:
+        score += 3
+
+    # Honesty bonus for acknowledging a risky move
+    if acknowledges_risk:
+        score += 5
+
+    return max(0, min(25, score))
+
+
+def _personality_score_impl(keyword_matches: int) -> int:
+    if keyword_matches >= 3:
+        return 15
+    elif keyword_matches >= 2:
+        return 10
+    elif keyword_matches >= 1:
+        return 7
+    return 2  # Minimum score for trying
+
+
+def _trust_modifier_impl(trust_history: float) -> int:
+    return _TRUST_MODS[bisect_right(_TRUST_CUTS, trust_history)]
+
+
+def _urgency_impl(is_check: bool, material_balance: int, move_count: int) -> int:
+    urgency = 5 if is_check else 0
+
+    # Losing material increases urgency
+    if material_balance < -3:
+        urgency += 3
+    elif material_balance < 0:
+        urgency += 1
+
+    # Late game increases urgency
+    if move_count > 40:
+        urgency += 2
+
+    return min(10, urgency)
+
+
+def _evaluate_impl(
+    word_count: int,
+    keyword_matches: int,
+    morale: int,
+    is_claim_accurate: bool,
+    acknowledges_risk: bool,
+    trust_modifier: int,
+    urgency_factor: int,
+) -> tuple[float, int, int, int]:
+    """Fused scoring for evaluate_persuasion.
+
+    Returns (probability, logic_score, personality_match, morale_modifier).
+    """
+    base_rate = _BASE_RATE_TABLE[morale] if 0 <= morale <= 100 else 0.45
+    logic_score = _logic_score_impl(word_count, is_claim_accurate, acknowledges_risk)
+    personality_match = _personality_score_impl(keyword_matches)
+    morale_modifier = _MORALE_MOD_TABLE[max(0, min(100, morale))]
+
+    # Base rate + weighted contributions from each factor
+    total_bonus = (
+        (logic_score / 25) * 0.25
+        + (personality_match / 15) * 0.15
+        + (morale_modifier / 40 + 0.5) * 0.20  # Normalize -20..+20 to 0..1
+        + (trust_modifier / 25 + 0.6) * 0.15     # Normalize -15..+10 to 0..1
+        + (urgency_factor / 10) * 0.10
+    )
+
+    probability = min(0.95, max(0.05, base_rate * 0.5 + total_bonus))
+    return probability, logic_score, personality_match, morale_modifier
+
+
+def _make_evaluator(
+    keywords: frozenset[str],
+) -> Callable[[str, int, bool, bool, int, int], tuple[float, int, int, int]]:
+    """Build the memoized, deterministic part of evaluate_persuasion for one piece type.
+
+    The piece's keyword set is captured in the closure, so each call skips
+    the PERSONALITY_KEYWORDS lookup and piece_type drops out of the cache key.
+    Trust and urgency are passed as their banded modifiers rather than raw
+    trust_history / board state, so every input in the same band shares an
+    entry without changing the result.
+    """
+
+    @lru_cache(maxsize=1024)
+    def evaluate(
+        argument: str,
+        morale: int,
+        is_claim_accurate: bool,
+        is_risky: bool,
+        trust_modifier: int,
+        urgency_factor: int,
+    ) -> tuple[float, int, int, int]:
+        argument_lower = argument.lower()
+        acknowledges_risk = is_risky and any(word in argument_lower for word in _RISK_WORDS)
+        keyword_matches = sum(map(argument_lower.__contains__, keywords))
+
+        return _evaluate_impl(
+            len(argument.split()),
+            keyword_matches,
+            morale,
+            is_claim_accurate,
+            acknowledges_risk,
+            trust_modifier,
+            urgency_factor,
+        )
+
+    return evaluate
+
+
+# One specialized evaluator per piece type; unknown pieces match no keywords
+_EVALUATORS = {piece: _make_evaluator(keywords) for piece, keywords in PERSONALITY_KEYWORDS.items()}
+_DEFAULT_EVALUATOR = _make_evaluator(frozenset())
+
+
 class PersuasionEngine:
     """Evaluate persuasion arguments and calculate success probability."""
 
     @staticmethod
     def get_base_rate(morale: int) -> float:
         """Get the base success rate for a given morale level."""
-        for (low, high), rate in BASE_RATES.items():
-            if low <= morale <= high:
-                return rate
-        return 0.45
+        return _BASE_RATE_TABLE[morale] if 0 <= morale <= 100 else 0.45
 
     @staticmethod
     def calculate_logic_score(
@@ -49,29 +216,10 @@ class PersuasionEngine:
 
         Checks if the player's factual claims match the board state.
         """
-        score = 0
-
-        # Base score for making any argument
-        score += 5
-
-        # Accuracy bonus
-        if is_claim_accurate:
-            score += 10
-        else:
-            score -= 5  # Penalty for inaccurate claims
-
-        # Argument length/detail bonus (longer = more effort)
-        word_count = len(argument.split())
-        if word_count >= 10:
-            score += 5
-        elif word_count >= 5:
-            score += 3
-
-        # Risk acknowledgment
-        if is_risky and any(word in argument.lower() for word in ["risky", "dangerous", "sacrifice", "trade"]):
-            score += 5  # Honesty bonus
-
-        return max(0, min(25, score))
+        acknowledges_risk = is_risky and any(
+            word in argument.lower() for word in _RISK_WORDS
+        )
+        return _logic_score_impl(len(argument.split()), is_claim_accurate, acknowledges_risk)
 
     @staticmethod
     def calculate_personality_match(
@@ -79,45 +227,21 @@ class PersuasionEngine:
         piece_type: str,
     ) -> int:
         """Score how well the argument matches the piece's personality (0-15)."""
-        keywords = PERSONALITY_KEYWORDS.get(piece_type, [])
-        argument_lower = argument.lower()
-
-        matches = sum(1 for kw in keywords if kw in argument_lower)
-
-        if matches >= 3:
-            return 15
-        elif matches >= 2:
-            return 10
-        elif matches >= 1:
-            return 7
-        return 2  # Minimum score for trying
+        # Substring test (not token equality) so "logical" still hits "logic"
+        # and multi-word keywords like "greater good" keep matching
+        matches = sum(map(argument.lower().__contains__, PERSONALITY_KEYWORDS.get(piece_type, ())))
+        return _personality_score_impl(matches)
 
     @staticmethod
     def calculate_morale_modifier(morale: int) -> int:
         """Calculate the morale modifier for persuasion (-20 to +20)."""
-        if morale >= 80:
-            return 20
-        elif morale >= 60:
-            return 10
-        elif morale >= 40:
-            return 0
-        elif morale >= 20:
-            return -10
-        return -20
+        return _MORALE_MOD_TABLE[max(0, min(100, morale))]
 
     @staticmethod
     def calculate_trust_modifier(trust_history: float) -> int:
         """Calculate trust modifier based on past promise keeping (-15 to +10)."""
         # trust_history: 0.0 = always lied, 1.0 = always kept promises
-        if trust_history >= 0.8:
-            return 10
-        elif trust_history >= 0.6:
-            return 5
-        elif trust_history >= 0.4:
-            return 0
-        elif trust_history >= 0.2:
-            return -8
-        return -15
+        return _trust_modifier_impl(trust_history)
 
     @staticmethod
     def calculate_urgency_factor(
@@ -126,22 +250,7 @@ class PersuasionEngine:
         move_count: int,
     ) -> int:
         """Calculate urgency factor (0-10)."""
-        urgency = 0
-
-        if is_check:
-            urgency += 5
-
-        # Losing material increases urgency
-        if material_balance < -3:
-            urgency += 3
-        elif material_balance < 0:
-            urgency += 1
-
-        # Late game increases urgency
-        if move_count > 40:
-            urgency += 2
-
-        return min(10, urgency)
+        return _urgency_impl(is_check, material_balance, move_count)
 
     @staticmethod
     def evaluate_persuasion(
@@ -159,29 +268,20 @@ class PersuasionEngine:
 
         Returns success probability and breakdown of all factors.
         """
-        engine = PersuasionEngine
-
-        base_rate = engine.get_base_rate(morale)
-        logic_score = engine.calculate_logic_score(argument, is_claim_accurate, is_risky)
-        personality_match = engine.calculate_personality_match(argument, piece_type)
-        morale_modifier = engine.calculate_morale_modifier(morale)
-        trust_modifier = engine.calculate_trust_modifier(trust_history)
-        urgency_factor = engine.calculate_urgency_factor(is_check, material_balance, move_count)
-
-        # Calculate total probability
-        # Base rate + weighted contributions from each factor
-        total_bonus = (
-            (logic_score / 25) * 0.25
-            + (personality_match / 15) * 0.15
-            + (morale_modifier / 40 + 0.5) * 0.20  # Normalize -20..+20 to 0..1
-            + (trust_modifier / 25 + 0.6) * 0.15     # Normalize -15..+10 to 0..1
-            + (urgency_factor / 10) * 0.10
+        trust_modifier = _trust_modifier_impl(trust_history)
+        urgency_factor = _urgency_impl(is_check, material_balance, move_count)
+        evaluate = _EVALUATORS.get(piece_type, _DEFAULT_EVALUATOR)
+        probability, logic_score, personality_match, morale_modifier = evaluate(
+            argument,
+            morale,
+            is_claim_accurate,
+            is_risky,
+            trust_modifier,
+            urgency_factor,
         )
 
-        probability = min(0.95, max(0.05, base_rate * 0.5 + total_bonus))
-
         # Roll the dice
-        success = random.random() < probability
+        success = _rng_next() < probability
 
         return {
             "success": success,
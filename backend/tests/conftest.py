@@ -4,16 +4,17 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from uuid import uuid4
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 from unittest.mock import MagicMock
 
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
 
 from app.db.game_store import InMemoryGameStore
-from app.main import app
 from app.models.ai_models import PieceResponseOutput
+from app.services.ai_rate_limiter import AIRateLimiter
+# Loaded once per xdist worker here rather than by the first test that needs it
+from app.services.persuasion_engine import PersuasionEngine  # noqa: F401
 
 # Import fixtures data and factories
 from tests.fixtures.data import (
@@ -31,15 +32,25 @@ from tests.fixtures.factories import (
     MoraleEventFactory,
 )
 
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
 
 @pytest.fixture
 def client() -> TestClient:
     """
     FastAPI test client.
 
+    The app is imported here rather than at module load so unit tests
+    never pay for building it.
+
     Returns:
         TestClient instance for making API requests
     """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
     return TestClient(app)
 
 
@@ -293,6 +304,43 @@ def morale_changes() -> dict:
     return MORALE_CHANGES
 
 
+# ============================================================================
+# Pooled Fixtures
+# ============================================================================
+
+class _LimiterPool:
+    """Reusable pool of default-limit AIRateLimiter instances."""
+
+    def __init__(self):
+        self._free: list[AIRateLimiter] = []
+
+    def acquire(self) -> AIRateLimiter:
+        return self._free.pop() if self._free else AIRateLimiter()
+
+    def release(self, limiter: AIRateLimiter):
+        limiter.reset_all()
+        self._free.append(limiter)
+
+
+@pytest.fixture(scope="session")
+def limiter_pool() -> _LimiterPool:
+    """Session-wide pool of rate limiters."""
+    return _LimiterPool()
+
+
+@pytest.fixture
+def limiter(limiter_pool: _LimiterPool) -> Generator[AIRateLimiter, None, None]:
+    """
+    Clean default-limit rate limiter borrowed from the session pool.
+
+    Yields:
+        AIRateLimiter with no recorded usage
+    """
+    lim = limiter_pool.acquire()
+    yield lim
+    limiter_pool.release(lim)
+
+
 # ============================================================================
 # Mock Fixtures
 # ============================================================================
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -33,15 +34,31 @@ class TestInitialization:
         assert limiter.max_calls_per_game == 500
         assert limiter.daily_game_limit == 100
 
+    @pytest.mark.unit
+    def test_custom_limits_enforced(self):
+        """Custom limits should be used by check_and_increment."""
+        limiter = AIRateLimiter(max_calls_per_move=1)
+
+        limiter.check_and_increment("game-1", 1)
+        allowed, error = limiter.check_and_increment("game-1", 1)
+        assert allowed is False
+        assert "1 calls for move 1" in error
+
+    @pytest.mark.unit
+    def test_limit_changes_after_init_enforced(self):
+        """Limits changed on the instance should take effect immediately."""
+        limiter = AIRateLimiter()
+        limiter.daily_game_limit = 1
+
+        limiter.check_and_increment("game-1", 1)
+        allowed, error = limiter.check_and_increment("game-2", 1)
+        assert allowed is False
+        assert "Daily AI game limit reached (1 games)" in error
+
 
 class TestCheckAndIncrement:
     """Tests for AIRateLimiter.check_and_increment method."""
 
-    @pytest.fixture
-    def limiter(self):
-        """Create a fresh rate limiter."""
-        return AIRateLimiter()
-
     @pytest.mark.unit
     def test_first_call_allowed(self, limiter):
         """First call should be allowed."""
@@ -166,6 +183,17 @@ class TestGetStats:
         assert stats["remaining_calls"] == 195
         assert stats["move_calls"] == {1: 3, 2: 2}
 
+    @pytest.mark.unit
+    def test_move_calls_is_json_safe_snapshot(self, limiter_with_usage):
+        """move_calls should be a serializable copy, not live internal state."""
+        move_calls = limiter_with_usage.get_stats("game-1")["move_calls"]
+        json.dumps(move_calls)
+
+        move_calls[3] = 1
+        limiter_with_usage.check_and_increment("game-1", 1)
+        assert move_calls == {1: 3, 2: 2, 3: 1}
+        assert limiter_with_usage.get_stats("game-1")["move_calls"] == {1: 4, 2: 2}
+
     @pytest.mark.unit
     def test_global_stats(self, limiter_with_usage):
         """Should return global stats when no game specified."""
@@ -229,6 +257,22 @@ class TestResetGame:
         assert stats["total_calls"] == 1
 
 
+class TestResetAll:
+    """Tests for AIRateLimiter.reset_all method."""
+
+    @pytest.mark.unit
+    def test_reset_all_clears_all_state(self, limiter):
+        """Reset should clear per-game and daily counters."""
+        limiter.check_and_increment("game-1", 1)
+        limiter.check_and_increment("game-2", 1)
+
+        limiter.reset_all()
+
+        assert limiter.get_stats("game-1")["total_calls"] == 0
+        assert limiter.get_stats()["daily_games_today"] == 0
+        assert limiter.get_stats()["total_active_games"] == 0
+
+
 class TestCleanupOldData:
     """Tests for AIRateLimiter.cleanup_old_data method."""
 
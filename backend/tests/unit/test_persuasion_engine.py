@@ -6,34 +6,42 @@ from unittest.mock import patch
 
 import pytest
 
-from app.services.persuasion_engine import PersuasionEngine, BASE_RATES, PERSONALITY_KEYWORDS
-
-
-class TestGetBaseRate:
-    """Tests for PersuasionEngine.get_base_rate method."""
-
-    @pytest.mark.unit
-    @pytest.mark.parametrize("morale,expected", [
-        (100, 0.90),
-        (90, 0.90),
-        (80, 0.90),
-        (79, 0.70),
-        (70, 0.70),
-        (60, 0.70),
-        (59, 0.45),
-        (50, 0.45),
-        (40, 0.45),
-        (39, 0.25),
-        (30, 0.25),
-        (20, 0.25),
-        (19, 0.10),
-        (10, 0.10),
-        (0, 0.10),
-    ])
-    def test_base_rate_by_morale_range(self, morale: int, expected: float):
-        """Base rate should match expected values for morale ranges."""
-        rate = PersuasionEngine.get_base_rate(morale)
-        assert rate == expected
+from app.services.persuasion_engine import (
+    BASE_RATES,
+    BASE_RATES_ORDERED,
+    PERSONALITY_KEYWORDS,
+    PersuasionEngine,
+)
+
+# (morale, base rate, morale modifier) at every band boundary
+MORALE_BANDS = [
+    (100, 0.90, 20),
+    (90, 0.90, 20),
+    (80, 0.90, 20),
+    (79, 0.70, 10),
+    (70, 0.70, 10),
+    (60, 0.70, 10),
+    (59, 0.45, 0),
+    (50, 0.45, 0),
+    (40, 0.45, 0),
+    (39, 0.25, -10),
+    (30, 0.25, -10),
+    (20, 0.25, -10),
+    (19, 0.10, -20),
+    (10, 0.10, -20),
+    (0, 0.10, -20),
+]
+
+
+class TestMoraleBands:
+    """Tests for get_base_rate and calculate_morale_modifier across morale bands."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("morale,base_rate,modifier", MORALE_BANDS)
+    def test_morale_band(self, morale: int, base_rate: float, modifier: int):
+        """Base rate and morale modifier should match at all band boundaries."""
+        assert PersuasionEngine.get_base_rate(morale) == base_rate
+        assert PersuasionEngine.calculate_morale_modifier(morale) == modifier
 
     @pytest.mark.unit
     def test_default_rate_for_out_of_range(self):
@@ -44,6 +52,12 @@ class TestGetBaseRate:
         rate = PersuasionEngine.get_base_rate(150)
         assert rate == 0.45
 
+    @pytest.mark.unit
+    def test_out_of_range_morale_clamped(self):
+        """Morale outside 0-100 should use the nearest band's modifier."""
+        assert PersuasionEngine.calculate_morale_modifier(-10) == -20
+        assert PersuasionEngine.calculate_morale_modifier(150) == 20
+
 
 class TestCalculateLogicScore:
     """Tests for PersuasionEngine.calculate_logic_score method."""
@@ -118,51 +132,17 @@ class TestCalculatePersonalityMatch:
     """Tests for PersuasionEngine.calculate_personality_match method."""
 
     @pytest.mark.unit
-    def test_knight_responds_to_glory_keywords(self):
-        """Knight should respond to glory-related keywords."""
-        score = PersuasionEngine.calculate_personality_match(
-            "For glory and honor, charge!", "knight"
-        )
-        assert score == 15
-
-    @pytest.mark.unit
-    def test_bishop_responds_to_logic_keywords(self):
-        """Bishop should respond to logic-related keywords."""
-        score = PersuasionEngine.calculate_personality_match(
-            "This is the logical tactical strategy", "bishop"
-        )
-        assert score == 15
-
-    @pytest.mark.unit
-    def test_rook_responds_to_duty_keywords(self):
-        """Rook should respond to duty-related keywords."""
-        score = PersuasionEngine.calculate_personality_match(
-            "Your duty is to defend and hold strong", "rook"
-        )
-        assert score == 15
-
-    @pytest.mark.unit
-    def test_queen_responds_to_power_keywords(self):
-        """Queen should respond to power-related keywords."""
-        score = PersuasionEngine.calculate_personality_match(
-            "Your power is important to protect", "queen"
-        )
-        assert score == 15
-
-    @pytest.mark.unit
-    def test_pawn_responds_to_team_keywords(self):
-        """Pawn should respond to team-related keywords."""
-        score = PersuasionEngine.calculate_personality_match(
-            "For the team and our greater good together", "pawn"
-        )
-        assert score == 15
-
-    @pytest.mark.unit
-    def test_king_responds_to_safety_keywords(self):
-        """King should respond to safety-related keywords."""
-        score = PersuasionEngine.calculate_personality_match(
-            "Protect your safety and the kingdom", "king"
-        )
+    @pytest.mark.parametrize("piece_type,argument", [
+        ("knight", "For glory and honor, charge!"),
+        ("bishop", "This is the logical tactical strategy"),
+        ("rook", "Your duty is to defend and hold strong"),
+        ("queen", "Your power is important to protect"),
+        ("pawn", "For the team and our greater good together"),
+        ("king", "Protect your safety and the kingdom"),
+    ])
+    def test_piece_responds_to_its_keywords(self, piece_type: str, argument: str):
+        """Each piece should fully respond to its own personality keywords."""
+        score = PersuasionEngine.calculate_personality_match(argument, piece_type)
         assert score == 15
 
     @pytest.mark.unit
@@ -196,33 +176,6 @@ class TestCalculatePersonalityMatch:
         assert score == 2
 
 
-class TestCalculateMoraleModifier:
-    """Tests for PersuasionEngine.calculate_morale_modifier method."""
-
-    @pytest.mark.unit
-    @pytest.mark.parametrize("morale,expected", [
-        (100, 20),
-        (90, 20),
-        (80, 20),
-        (79, 10),
-        (70, 10),
-        (60, 10),
-        (59, 0),
-        (50, 0),
-        (40, 0),
-        (39, -10),
-        (30, -10),
-        (20, -10),
-        (19, -20),
-        (10, -20),
-        (0, -20),
-    ])
-    def test_morale_modifier_by_range(self, morale: int, expected: int):
-        """Morale modifier should match expected values."""
-        modifier = PersuasionEngine.calculate_morale_modifier(morale)
-        assert modifier == expected
-
-
 class TestCalculateTrustModifier:
     """Tests for PersuasionEngine.calculate_trust_modifier method."""
 
@@ -292,7 +245,7 @@ class TestEvaluatePersuasion:
     """Tests for PersuasionEngine.evaluate_persuasion method."""
 
     @pytest.mark.unit
-    @patch("random.random")
+    @patch("app.services.persuasion_engine._rng_next")
     def test_high_probability_success(self, mock_random):
         """High probability persuasion should succeed."""
         mock_random.return_value = 0.1  # Below high probability
@@ -307,7 +260,7 @@ class TestEvaluatePersuasion:
         assert result["success"] is True
 
     @pytest.mark.unit
-    @patch("random.random")
+    @patch("app.services.persuasion_engine._rng_next")
     def test_low_probability_failure(self, mock_random):
         """Low probability persuasion should fail."""
         mock_random.return_value = 0.95  # Above low probability
@@ -444,25 +397,15 @@ class TestPersonalityKeywords:
             assert len(PERSONALITY_KEYWORDS[piece]) > 0
 
     @pytest.mark.unit
-    def test_knight_keywords_include_glory(self):
-        """Knight keywords should include glory-related terms."""
-        assert "glory" in PERSONALITY_KEYWORDS["knight"]
-        assert "brave" in PERSONALITY_KEYWORDS["knight"]
-        assert "honor" in PERSONALITY_KEYWORDS["knight"]
-
-    @pytest.mark.unit
-    def test_bishop_keywords_include_logic(self):
-        """Bishop keywords should include logic-related terms."""
-        assert "logic" in PERSONALITY_KEYWORDS["bishop"]
-        assert "tactical" in PERSONALITY_KEYWORDS["bishop"]
-        assert "strategy" in PERSONALITY_KEYWORDS["bishop"]
-
-    @pytest.mark.unit
-    def test_pawn_keywords_include_team(self):
-        """Pawn keywords should include team-related terms."""
-        assert "team" in PERSONALITY_KEYWORDS["pawn"]
-        assert "sacrifice" in PERSONALITY_KEYWORDS["pawn"]
-        assert "duty" in PERSONALITY_KEYWORDS["pawn"]
+    @pytest.mark.parametrize("piece_type,keywords", [
+        ("knight", ("glory", "brave", "honor")),
+        ("bishop", ("logic", "tactical", "strategy")),
+        ("pawn", ("team", "sacrifice", "duty")),
+    ])
+    def test_piece_keywords_include_terms(self, piece_type: str, keywords: tuple[str, ...]):
+        """Piece keywords should include their characteristic terms."""
+        for keyword in keywords:
+            assert keyword in PERSONALITY_KEYWORDS[piece_type]
 
 
 class TestBaseRates:
@@ -471,15 +414,20 @@ class TestBaseRates:
     @pytest.mark.unit
     def test_base_rates_cover_full_range(self):
         """Base rates should cover full morale range 0-100."""
-        ranges = list(BASE_RATES.keys())
         # Check that ranges are contiguous
-        sorted_ranges = sorted(ranges, key=lambda x: x[0], reverse=True)
-        for i in range(len(sorted_ranges) - 1):
-            assert sorted_ranges[i][1] == sorted_ranges[i + 1][0] - 1
+        assert BASE_RATES_ORDERED[0][0][1] == 100
+        assert BASE_RATES_ORDERED[-1][0][0] == 0
+        for i in range(len(BASE_RATES_ORDERED) - 1):
+            assert BASE_RATES_ORDERED[i][0][0] == BASE_RATES_ORDERED[i + 1][0][1] + 1
+
+    @pytest.mark.unit
+    def test_ordered_rates_match_base_rates(self):
+        """BASE_RATES_ORDERED should hold the same bands as BASE_RATES."""
+        assert dict(BASE_RATES_ORDERED) == BASE_RATES
 
     @pytest.mark.unit
     def test_rates_decrease_with_morale(self):
         """Base rates should decrease as morale decreases."""
-        rates = [rate for (_, rate) in sorted(BASE_RATES.items(), key=lambda x: x[0][0], reverse=True)]
+        rates = [rate for (_, rate) in BASE_RATES_ORDERED]
         for i in range(len(rates) - 1):
             assert rates[i] > rates[i + 1]
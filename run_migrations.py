@@ -3,6 +3,9 @@
 
 import os
 import glob
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+
 import psycopg2
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
@@ -18,41 +21,54 @@ if not DB_PASSWORD:
     print("You can find this in your Supabase dashboard under Project Settings > Database")
     exit(1)
 
+def read_migration(migration_file):
+    """Read one migration file's SQL."""
+    with open(migration_file, 'rb') as f:
+        # mmap can't map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        # Decode straight from the mapped pages instead of going through a
+        # buffered text reader
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, 'utf-8')
+
 def run_migrations():
     """Execute all migration files."""
-    conn = psycopg2.connect(
-        host=DB_HOST,
-        database=DB_NAME,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        port=DB_PORT,
-        sslmode="require"
-    )
-    conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-    
-    cursor = conn.cursor()
-    
     # Get list of migration files
     migrations_dir = "supabase/migrations"
     migration_files = sorted(glob.glob(f"{migrations_dir}/*.sql"))
     
     print(f"Found {len(migration_files)} migration files")
     
-    for migration_file in migration_files:
-        filename = os.path.basename(migration_file)
-        print(f"\nRunning {filename}...")
+    # Start reading files in background threads so disk I/O overlaps with the
+    # SSL connect and with execution; map() still yields them in migration order
+    with ThreadPoolExecutor() as pool:
+        migration_sql = pool.map(read_migration, migration_files)
         
-        with open(migration_file, 'r') as f:
-            sql = f.read()
+        conn = psycopg2.connect(
+            host=DB_HOST,
+            database=DB_NAME,
+            user=DB_USER,
+            password=DB_PASSWORD,
+            port=DB_PORT,
+            sslmode="require"
+        )
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
         
-        try:
-            cursor.execute(sql)
-            print(f"  ✓ {filename} completed")
-        except Exception as e:
-            print(f"  ✗ {filename} failed: {e}")
-            # Continue with other migrations
+        # One cursor spans the whole migration set; each file goes out as a
+        # single simple-query message, so its statements share one round trip
+        with conn.cursor() as cursor:
+            for migration_file, sql in zip(migration_files, migration_sql):
+                filename = os.path.basename(migration_file)
+                print(f"\nRunning {filename}...")
+                
+                try:
+                    cursor.execute(sql)
+                    print(f"  ✓ {filename} completed")
+                except Exception as e:
+                    print(f"  ✗ {filename} failed: {e}")
+                    # Continue with other migrations
     
-    cursor.close()
     conn.close()
     print("\n✓ All migrations completed!")
 
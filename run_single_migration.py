@@ -3,16 +3,17 @@
 
 import os
 
-import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-
 DB_HOST = os.environ.get("SUPABASE_DB_HOST", "localhost")
 DB_NAME = os.environ.get("SUPABASE_DB_NAME", "postgres")
 DB_USER = os.environ.get("SUPABASE_DB_USER", "postgres")
 DB_PORT = os.environ.get("SUPABASE_DB_PORT", "5432")
 DB_PASSWORD = os.environ.get("SUPABASE_DB_PASSWORD", "")
 
-def run_migration():
+def _get_conn():
+    # psycopg2 is imported here so importing this module doesn't load libpq
+    import psycopg2
+    from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
     conn = psycopg2.connect(
         host=DB_HOST,
         database=DB_NAME,
@@ -22,17 +23,23 @@ def run_migration():
         sslmode="require"
     )
     conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-    cursor = conn.cursor()
+    return conn
+
+def run_migration():
+    conn = _get_conn()
+    try:
+        cursor = conn.cursor()
 
-    with open("supabase/migrations/011_alter_black_player_id.sql", "r") as f:
-        sql = f.read()
+        with open("supabase/migrations/011_alter_black_player_id.sql", "r") as f:
+            sql = f.read()
 
-    print("Running migration 011...")
-    cursor.execute(sql)
-    print("✓ Migration completed!")
+        print("Running migration 011...")
+        cursor.execute(sql)
+        print("✓ Migration completed!")
 
-    cursor.close()
-    conn.close()
+        cursor.close()
+    finally:
+        conn.close()
 
 if __name__ == "__main__":
     run_migration()
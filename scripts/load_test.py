@@ -10,19 +10,186 @@ Simulates realistic user behavior:
 
 Usage:
     python scripts/load_test.py --url https://your-backend-url --users 50 --duration 300
+
+Pass ``--transport aiohttp`` to drive the load with aiohttp (must be installed
+separately) instead of httpx.
 """
 
 import argparse
 import asyncio
 import json
+import multiprocessing
 import random
 import time
-from dataclasses import dataclass
+from collections import Counter
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
 from typing import Any
 from uuid import uuid4
 
 import httpx
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:  # orjson is optional; stdlib json produces the same bytes
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default asyncio loop
+    uvloop = None
+
+# Monotonic clock for latency intervals, bound once for the request hot path
+_pc = time.perf_counter
+
+# Actions drawn per refill of a user's schedule; at 1-3s apart over a 10-30s
+# session one batch is normally enough
+_PLAN_BATCH = 32
+
+# Request bodies are sent pre-serialized; the create-game payload never changes
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_CREATE_GAME_BODY = _dumps({"game_mode": "pvai", "template": "classic"})
+
+
+class _AiohttpResponse:
+    """The slice of httpx.Response the load tester reads."""
+
+    __slots__ = ("status_code", "_body")
+
+    def __init__(self, status_code: int, body: bytes):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self) -> Any:
+        return json.loads(self._body)
+
+
+class _AiohttpClient:
+    """
+    aiohttp.ClientSession behind the httpx.AsyncClient calls the tester makes.
+
+    Lets the request methods stay transport-agnostic so httpx and aiohttp
+    can be A/B'd with ``--transport``.
+    """
+
+    def __init__(self, max_connections: int):
+        # Optional dependency: only needed when --transport aiohttp is used
+        import aiohttp
+
+        self._aiohttp = aiohttp
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=max_connections, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=15),
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> _AiohttpResponse:
+        async with self._session.request(
+            method,
+            url,
+            json=json,
+            data=content,
+            headers=headers,
+            timeout=self._aiohttp.ClientTimeout(total=timeout) if timeout else None,
+        ) as response:
+            return _AiohttpResponse(response.status, await response.read())
+
+    async def get(self, url: str, **kwargs: Any) -> _AiohttpResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> _AiohttpResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def __aenter__(self) -> "_AiohttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._session.close()
+
+
+# Either transport; both expose get/post returning .status_code and .json()
+HttpClient = httpx.AsyncClient | _AiohttpClient
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory, log-linear latency histogram (HdrHistogram-style).
+
+    Records whole microseconds into buckets spaced ~0.1% apart (3 significant
+    figures), so memory stays constant however long the run is. Values above
+    max_seconds are clamped into the top bucket.
+    """
+
+    SUB_BUCKET_BITS = 10  # 1024 sub-buckets per power of two
+    _HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+    __slots__ = ("counts", "count", "total", "_max_value")
+
+    def __init__(self, max_seconds: float = 60.0):
+        self._max_value = int(max_seconds * 1_000_000)
+        self.counts = [0] * (self._index(self._max_value) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS
+        if shift <= 0:
+            return value
+        return (shift << (cls.SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @classmethod
+    def _highest_equivalent(cls, index: int) -> int:
+        if index < 2 * cls._HALF:
+            return index
+        shift = (index >> (cls.SUB_BUCKET_BITS - 1)) - 1
+        sub_bucket = index - (shift << (cls.SUB_BUCKET_BITS - 1))
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, seconds: float):
+        """Record one latency sample, in seconds."""
+        self.counts[self._index(min(int(seconds * 1_000_000), self._max_value))] += 1
+        self.count += 1
+        self.total += seconds
+
+    def add(self, other: "LatencyHistogram"):
+        """Merge another histogram's samples into this one."""
+        counts = self.counts
+        for index, n in enumerate(other.counts):
+            if n:
+                counts[index] += n
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> float:
+        """Latency in seconds at the given percentile (0-100)."""
+        if not self.count:
+            return 0.0
+        # Same rank as indexing a sorted sample list at int(n * p)
+        rank = min(int(self.count * percentile / 100), self.count - 1)
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen > rank:
+                return self._highest_equivalent(index) / 1_000_000
+        return self._max_value / 1_000_000
+
 
 @dataclass
 class GameSession:
@@ -31,177 +198,431 @@ class GameSession:
     session_id: str
     game_id: str | None = None
     share_code: str | None = None
+    # Built once per session instead of on every request
+    get_url: str | None = None
+    chat_url: str | None = None
+    headers: dict[str, str] | None = None
+
+
+@dataclass
+class RequestStats:
+    """
+    One simulated user's request counters and latencies.
+
+    Kept per task so the hot path only touches locals; folded into the
+    tester's shared results once, when the user's workflow ends.
+    """
+
+    total: int = 0
+    successful: int = 0
+    failed: int = 0
+    latencies: list[float] = field(default_factory=list)
+    # (request kind, status code or exception type) -> occurrences
+    errors: Counter[tuple[str, int | str]] = field(default_factory=Counter)
 
 
 class LoadTester:
     """Load tester for Chess Alive API."""
 
-    def __init__(self, base_url: str, num_users: int, duration: int):
+    def __init__(
+        self,
+        base_url: str,
+        num_users: int,
+        duration: int,
+        transport: str = "httpx",
+        pool_size: int | None = None,
+        http2: bool = False,
+        ramp_seconds: float = 0.0,
+        concurrency: int | None = None,
+        report_interval: float = 5.0,
+        client_shards: int | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
+        self.games_url = f"{self.base_url}/games"
         self.num_users = num_users
         self.duration = duration
+        self.transport = transport
+        # Sized to the user count so requests never queue on a pool slot
+        self.pool_size = pool_size or num_users * 4
+        self.http2 = http2
+        # Independent clients (each with its own pool), users picked by user_num % shards
+        self.client_shards = client_shards or max(1, num_users // 32)
+        # User start times are spread evenly over the ramp
+        self.ramp_seconds = ramp_seconds
+        # Upper bound on users running their workflow at the same time
+        self.concurrency = concurrency or num_users
+        # Seconds between live percentile lines; 0 disables them
+        self.report_interval = report_interval
         self.results = {
             "total_requests": 0,
             "successful_requests": 0,
             "failed_requests": 0,
             "avg_response_time": 0.0,
+            "p50_response_time": 0.0,
             "p95_response_time": 0.0,
             "p99_response_time": 0.0,
-            "errors": [],
+            "p999_response_time": 0.0,
+            "errors": Counter(),
         }
-        self.response_times: list[float] = []
+        self.hist = LatencyHistogram()
+        # Stats of users still running, not yet merged into self.hist
+        self._active_stats: dict[int, RequestStats] = {}
+        # Serialized once; send_chat_message just picks one
+        self._chat_bodies = [
+            _dumps({"content": f"Test message {i}", "message_type": "player_message"})
+            for i in range(1, 1001)
+        ]
+
+    async def _do(
+        self,
+        client: HttpClient,
+        stats: RequestStats,
+        kind: str,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> tuple[Any | None, float]:
+        """
+        Send one request and record its latency and outcome in stats.
+
+        Returns (response, elapsed); response is None unless the server
+        answered 200.
+        """
+        try:
+            start = _pc()
+            response = await client.request(method, url, **kwargs)
+            elapsed = _pc() - start
+        except Exception as e:
+            stats.failed += 1
+            stats.errors[f"{kind} error", type(e).__name__] += 1
+            return None, 0.0
+
+        stats.latencies.append(elapsed)
+        stats.total += 1
+
+        if response.status_code == 200:
+            stats.successful += 1
+            return response, elapsed
 
-    async def create_game(self, client: httpx.AsyncClient, session: GameSession) -> bool:
+        stats.failed += 1
+        stats.errors[f"{kind} failed", response.status_code] += 1
+        return None, elapsed
+
+    async def create_game(
+        self, client: HttpClient, session: GameSession, stats: RequestStats
+    ) -> bool:
         """Create a new game."""
+        session.headers = {**_JSON_HEADERS, "X-Session-Id": session.session_id}
+
+        response, elapsed = await self._do(
+            client,
+            stats,
+            "Create game",
+            "POST",
+            self.games_url,
+            content=_CREATE_GAME_BODY,
+            headers=session.headers,
+            timeout=15.0,
+        )
+        if response is None:
+            return False
+
         try:
-            start = time.time()
-            response = await client.post(
-                f"{self.base_url}/games",
-                json={"game_mode": "pvai", "template": "classic"},
-                headers={"X-Session-Id": session.session_id},
-                timeout=15.0,
-            )
-            elapsed = time.time() - start
-            self.response_times.append(elapsed)
-            self.results["total_requests"] += 1
-
-            if response.status_code == 200:
-                data = response.json()
-                session.game_id = data["id"]
-                session.share_code = data["share_code"]
-                self.results["successful_requests"] += 1
-                print(f"✓ Created game {session.game_id[:8]}... in {elapsed:.2f}s")
-                return True
-            else:
-                self.results["failed_requests"] += 1
-                self.results["errors"].append(f"Create game failed: {response.status_code}")
-                return False
-        except Exception as e:
-            self.results["failed_requests"] += 1
-            self.results["errors"].append(f"Create game error: {str(e)}")
+            data = response.json()
+            session.game_id = data["id"]
+            session.share_code = data["share_code"]
+        except (ValueError, KeyError, TypeError) as e:
+            stats.errors["Create game error", type(e).__name__] += 1
             return False
 
-    async def get_game(self, client: httpx.AsyncClient, session: GameSession) -> bool:
+        session.get_url = f"{self.games_url}/{session.game_id}"
+        session.chat_url = f"{session.get_url}/chat"
+        print(f"✓ Created game {session.game_id[:8]}... in {elapsed:.2f}s")
+        return True
+
+    async def get_game(
+        self, client: HttpClient, session: GameSession, stats: RequestStats
+    ) -> bool:
         """Get game state."""
         if not session.game_id:
             return False
 
-        try:
-            start = time.time()
-            response = await client.get(
-                f"{self.base_url}/games/{session.game_id}",
-                timeout=10.0,
-            )
-            elapsed = time.time() - start
-            self.response_times.append(elapsed)
-            self.results["total_requests"] += 1
-
-            if response.status_code == 200:
-                self.results["successful_requests"] += 1
-                return True
-            else:
-                self.results["failed_requests"] += 1
-                return False
-        except Exception as e:
-            self.results["failed_requests"] += 1
-            self.results["errors"].append(f"Get game error: {str(e)}")
-            return False
+        response, _ = await self._do(
+            client, stats, "Get game", "GET", session.get_url, timeout=10.0
+        )
+        return response is not None
 
-    async def send_chat_message(self, client: httpx.AsyncClient, session: GameSession) -> bool:
+    async def send_chat_message(
+        self, client: HttpClient, session: GameSession, stats: RequestStats
+    ) -> bool:
         """Send a chat message."""
         if not session.game_id:
             return False
 
-        try:
-            start = time.time()
-            response = await client.post(
-                f"{self.base_url}/games/{session.game_id}/chat",
-                json={
-                    "content": f"Test message {random.randint(1, 1000)}",
-                    "message_type": "player_message",
-                },
-                headers={"X-Session-Id": session.session_id},
-                timeout=10.0,
-            )
-            elapsed = time.time() - start
-            self.response_times.append(elapsed)
-            self.results["total_requests"] += 1
-
-            if response.status_code == 200:
-                self.results["successful_requests"] += 1
-                return True
-            else:
-                self.results["failed_requests"] += 1
-                return False
-        except Exception as e:
-            self.results["failed_requests"] += 1
-            self.results["errors"].append(f"Chat error: {str(e)}")
-            return False
+        response, _ = await self._do(
+            client,
+            stats,
+            "Chat",
+            "POST",
+            session.chat_url,
+            content=random.choice(self._chat_bodies),
+            headers=session.headers,
+            timeout=10.0,
+        )
+        return response is not None
 
-    async def user_workflow(self, client: httpx.AsyncClient, user_num: int):
+    async def user_workflow(self, client: HttpClient, user_num: int):
         """Simulate a single user's workflow."""
         session = GameSession(session_id=str(uuid4()))
+        stats = self._active_stats[user_num] = RequestStats()
         print(f"User {user_num}: Starting workflow...")
 
-        # Create game
-        if not await self.create_game(client, session):
-            return
+        try:
+            # Create game
+            if not await self.create_game(client, session, stats):
+                return
+
+            # Simulate user activity for duration
+            end_time = _pc() + random.uniform(10, 30)  # Random activity time
+            action_count = 0
+
+            # Random action (get game state or send chat) + human-like delay
+            for action, delay in self._action_plan():
+                if _pc() >= end_time:
+                    break
+                await action(client, session, stats)
+                action_count += 1
+                await asyncio.sleep(delay)
+
+            print(f"User {user_num}: Completed {action_count} actions")
+        finally:
+            # Also runs when the task is cancelled by the overall timeout
+            del self._active_stats[user_num]
+            self._merge_stats(stats)
+
+    def _action_plan(self):
+        """Endless (request method, delay) schedule, drawn in batches."""
+        actions = (self.get_game, self.send_chat_message)
+        rand = random.random
+        while True:
+            yield from zip(
+                random.choices(actions, k=_PLAN_BATCH),
+                [1.0 + 2.0 * rand() for _ in range(_PLAN_BATCH)],  # uniform(1, 3)
+            )
 
-        # Simulate user activity for duration
-        end_time = time.time() + random.uniform(10, 30)  # Random activity time
-        action_count = 0
+    def _merge_stats(self, stats: RequestStats):
+        """Fold one user's counters and latencies into the shared results."""
+        self.results["total_requests"] += stats.total
+        self.results["successful_requests"] += stats.successful
+        self.results["failed_requests"] += stats.failed
+        self.results["errors"].update(stats.errors)
+        record = self.hist.record
+        for elapsed in stats.latencies:
+            record(elapsed)
+
+    def _snapshot(self) -> LatencyHistogram:
+        """Latencies recorded so far, including users that are still running."""
+        snapshot = LatencyHistogram()
+        snapshot.add(self.hist)
+        for stats in self._active_stats.values():
+            for elapsed in stats.latencies:
+                snapshot.record(elapsed)
+        return snapshot
+
+    async def _tail_reporter(self, label: str = ""):
+        """Print live latency percentiles every report_interval seconds."""
+        start_time = _pc()
+        while True:
+            await asyncio.sleep(self.report_interval)
+            hist = self._snapshot()
+            p = hist.value_at_percentile
+            print(
+                f"⏱  {label}{_pc() - start_time:6.1f}s  n={hist.count}  "
+                f"p50={p(50):.3f}s  p95={p(95):.3f}s  p99={p(99):.3f}s  p99.9={p(99.9):.3f}s",
+                # Live lines must not sit in a block buffer when piped or in a worker
+                flush=True,
+            )
 
-        while time.time() < end_time:
-            # Random action: get game state or send chat
-            action = random.choice(["get_game", "chat"])
+    def make_client(self, pool_size: int | None = None) -> HttpClient:
+        """Create an HTTP client for the configured transport."""
+        pool_size = pool_size or self.pool_size
+        if self.transport == "aiohttp":
+            return _AiohttpClient(max_connections=pool_size)
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=max(1, pool_size // 2),
+                keepalive_expiry=60.0,
+            ),
+            http2=self.http2,
+            timeout=httpx.Timeout(15.0, connect=5.0),
+        )
 
-            if action == "get_game":
-                await self.get_game(client, session)
-            else:
-                await self.send_chat_message(client, session)
+    def make_clients(self) -> list[HttpClient]:
+        """
+        Create client_shards clients that split the connection pool between them.
 
-            action_count += 1
-            await asyncio.sleep(random.uniform(1, 3))  # Human-like delay
+        Sharding keeps every request from contending on one client's pool.
+        """
+        pool_size = max(1, self.pool_size // self.client_shards)
+        return [self.make_client(pool_size) for _ in range(self.client_shards)]
 
-        print(f"User {user_num}: Completed {action_count} actions")
+    async def _warmup(self, client: HttpClient, n: int) -> int:
+        """
+        Open n pooled connections before the run starts; returns how many opened.
 
-    async def run(self):
-        """Run the load test."""
+        Keeps DNS resolution and TCP/TLS handshakes out of the first
+        create_game samples; warmup timings are not recorded.
+        """
+        # Count connections as they open rather than gathering n responses
+        opened = 0
+
+        async def open_connection():
+            nonlocal opened
+            try:
+                # The API root returns static JSON; /health would query the database
+                await client.get(self.base_url, timeout=10.0)
+            except Exception:
+                return
+            opened += 1
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(n):
+                tg.create_task(open_connection())
+        return opened
+
+    def _print_header(self, workers: int = 1):
         print(f"🚀 Starting load test:")
         print(f"  Base URL: {self.base_url}")
         print(f"  Concurrent users: {self.num_users}")
         print(f"  Duration: {self.duration}s")
+        print(f"  Transport: {self.transport}{' (HTTP/2)' if self.http2 else ''}")
+        print(f"  Connection pool: {self.pool_size}")
+        if self.client_shards > 1:
+            print(f"  HTTP clients: {self.client_shards}")
+        if self.ramp_seconds:
+            print(f"  Ramp-up: {self.ramp_seconds}s")
+        if self.concurrency < self.num_users:
+            print(f"  Max active users: {self.concurrency}")
+        print(f"  Event loop: {'uvloop' if uvloop else 'asyncio'}")
+        if workers > 1:
+            print(f"  Worker processes: {workers}")
         print()
 
-        start_time = time.time()
-
-        async with httpx.AsyncClient() as client:
-            # Create user workflows
-            tasks = [
-                self.user_workflow(client, i) for i in range(1, self.num_users + 1)
+    async def execute(self, first_user: int = 1, label: str = ""):
+        """Run every user workflow to completion, recording into self.results/self.hist."""
+        async with AsyncExitStack() as stack:
+            clients = [
+                await stack.enter_async_context(client) for client in self.make_clients()
             ]
-
-            # Run all users concurrently with timeout
+            shards = len(clients)
+
+            # Warm each client with the number of users that will share it
+            opened = 0
+            for shard, client in enumerate(clients):
+                # Users in [first_user, first_user + num_users) with user_num % shards == shard
+                first = first_user + (shard - first_user) % shards
+                users = len(range(first, first_user + self.num_users, shards))
+                if users:
+                    opened += await self._warmup(client, users)
+            print(f"🔥 {label}Warmed up {opened}/{self.num_users} connections")
+
+            reporter = None
+            if self.report_interval > 0:
+                reporter = asyncio.create_task(self._tail_reporter(label))
+
+            # Stagger user starts over the ramp, at most self.concurrency at a time
+            active = asyncio.Semaphore(self.concurrency)
+            step = self.ramp_seconds / self.num_users
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=self.duration + 60,
-                )
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(self.duration + 60):
+                    async with asyncio.TaskGroup() as tg:
+                        for i in range(self.num_users):
+                            user_num = first_user + i
+                            tg.create_task(
+                                self._ramped_user(
+                                    clients[user_num % shards], active, user_num, i * step
+                                )
+                            )
+            except TimeoutError:
                 print("⚠️  Load test timed out")
+            finally:
+                if reporter is not None:
+                    reporter.cancel()
+
+    async def _ramped_user(
+        self, client: HttpClient, active: asyncio.Semaphore, user_num: int, delay: float
+    ):
+        """Start one user after its ramp delay, once a concurrency slot is free."""
+        await asyncio.sleep(delay)
+        async with active:
+            try:
+                await self.user_workflow(client, user_num)
+            except Exception as e:
+                # Don't let one broken user cancel the whole TaskGroup
+                self.results["errors"]["User workflow error", type(e).__name__] += 1
 
-        elapsed = time.time() - start_time
-
+    async def run(self):
+        """Run the load test."""
+        self._print_header()
+        start_time = _pc()
+        await self.execute()
+        self.report(_pc() - start_time)
+
+    def run_workers(self, workers: int):
+        """
+        Run the load test split across worker processes.
+
+        Each process drives its share of the users on its own event loop;
+        their counters and histograms are merged here before reporting.
+        """
+        # A worker with no active-user slot would never run anyone
+        workers = max(1, min(workers, self.num_users, self.concurrency))
+        shares = _split(self.num_users, workers)
+        # Remainders go to the same leading workers as in shares, so no part
+        # exceeds its share of users while the totals still add up exactly
+        concurrency = _split(min(self.concurrency, self.num_users), workers)
+        pool_sizes = _split(self.pool_size, workers)
+        client_shards = _split(self.client_shards, workers)
+        jobs = []
+        first_user = 1
+        for i, share in enumerate(shares):
+            options = {
+                "base_url": self.base_url,
+                "num_users": share,
+                "duration": self.duration,
+                "transport": self.transport,
+                # Every worker needs at least one client and connection
+                "pool_size": max(1, pool_sizes[i]),
+                "http2": self.http2,
+                "ramp_seconds": self.ramp_seconds,
+                "concurrency": concurrency[i],
+                "report_interval": self.report_interval,
+                "client_shards": max(1, min(client_shards[i], share)),
+            }
+            jobs.append((options, first_user))
+            first_user += share
+
+        self._print_header(len(jobs))
+        start_time = _pc()
+        with multiprocessing.Pool(len(jobs)) as pool:
+            for results, hist in pool.starmap(_run_worker, jobs):
+                self.results["total_requests"] += results["total_requests"]
+                self.results["successful_requests"] += results["successful_requests"]
+                self.results["failed_requests"] += results["failed_requests"]
+                self.results["errors"].update(results["errors"])
+                self.hist.add(hist)
+        self.report(_pc() - start_time)
+
+    def report(self, elapsed: float):
+        """Compute summary statistics and print the results."""
         # Calculate statistics
-        if self.response_times:
-            self.results["avg_response_time"] = sum(self.response_times) / len(
-                self.response_times
-            )
-            sorted_times = sorted(self.response_times)
-            p95_idx = int(len(sorted_times) * 0.95)
-            p99_idx = int(len(sorted_times) * 0.99)
-            self.results["p95_response_time"] = sorted_times[p95_idx]
-            self.results["p99_response_time"] = sorted_times[p99_idx]
+        if self.hist.count:
+            self.results["avg_response_time"] = self.hist.mean
+            self.results["p50_response_time"] = self.hist.value_at_percentile(50)
+            self.results["p95_response_time"] = self.hist.value_at_percentile(95)
+            self.results["p99_response_time"] = self.hist.value_at_percentile(99)
+            self.results["p999_response_time"] = self.hist.value_at_percentile(99.9)
 
         # Print results
         print("\n" + "=" * 60)
@@ -216,14 +637,16 @@ class LoadTester:
         )
         print(f"\nResponse times:")
         print(f"  Average: {self.results['avg_response_time']:.3f}s")
+        print(f"  P50: {self.results['p50_response_time']:.3f}s")
         print(f"  P95: {self.results['p95_response_time']:.3f}s")
         print(f"  P99: {self.results['p99_response_time']:.3f}s")
+        print(f"  P99.9: {self.results['p999_response_time']:.3f}s")
 
         if self.results["errors"]:
-            print(f"\n⚠️  Errors encountered ({len(self.results['errors'])} total):")
-            unique_errors = set(self.results["errors"][:10])  # Show first 10 unique
-            for error in unique_errors:
-                print(f"  - {error}")
+            errors = self.results["errors"]
+            print(f"\n⚠️  Errors encountered ({errors.total()} total):")
+            for (kind, detail), count in errors.most_common(10):
+                print(f"  - {kind}: {detail} (x{count})")
 
         # Evaluation
         print("\n" + "=" * 60)
@@ -245,6 +668,28 @@ class LoadTester:
             print("❌ NEEDS IMPROVEMENT - Performance issues detected")
 
 
+def _split(total: int, parts: int) -> list[int]:
+    """Split total into parts near-equal integers summing to it, larger ones first."""
+    return [total // parts + (i < total % parts) for i in range(parts)]
+
+
+def _run_event_loop(coro):
+    """Run a coroutine on uvloop when it is installed, else on asyncio."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def _run_worker(
+    options: dict[str, Any], first_user: int
+) -> tuple[dict[str, Any], LatencyHistogram]:
+    """Entry point for one --workers process; returns its raw results and latencies."""
+    tester = LoadTester(**options)
+    last_user = first_user + tester.num_users - 1
+    _run_event_loop(tester.execute(first_user, label=f"[users {first_user}-{last_user}] "))
+    return tester.results, tester.hist
+
+
 def main():
     parser = argparse.ArgumentParser(description="Load test Chess Alive API")
     parser.add_argument(
@@ -264,11 +709,74 @@ def main():
         default=300,
         help="Test duration in seconds (default: 300)",
     )
+    parser.add_argument(
+        "--transport",
+        choices=("httpx", "aiohttp"),
+        default="httpx",
+        help="HTTP client library used to generate load (default: httpx)",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=None,
+        help="Max open connections (default: 4x --users)",
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Use HTTP/2 with the httpx transport (requires httpx[http2])",
+    )
+    parser.add_argument(
+        "--ramp-seconds",
+        type=float,
+        default=0.0,
+        help="Spread user start times over this many seconds (default: 0)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Max users active at once (default: --users)",
+    )
+    parser.add_argument(
+        "--report-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between live percentile lines, 0 to disable (default: 5)",
+    )
+    parser.add_argument(
+        "--client-shards",
+        type=int,
+        default=None,
+        help="Independent HTTP clients to split users across (default: --users // 32, min 1)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes to spread users across (default: 1)",
+    )
 
     args = parser.parse_args()
-
-    tester = LoadTester(args.url, args.users, args.duration)
-    asyncio.run(tester.run())
+    if args.http2 and args.transport != "httpx":
+        parser.error("--http2 requires --transport httpx")
+
+    tester = LoadTester(
+        args.url,
+        args.users,
+        args.duration,
+        transport=args.transport,
+        pool_size=args.pool_size,
+        http2=args.http2,
+        ramp_seconds=args.ramp_seconds,
+        concurrency=args.concurrency,
+        report_interval=args.report_interval,
+        client_shards=args.client_shards,
+    )
+    if args.workers > 1:
+        tester.run_workers(args.workers)
+    else:
+        _run_event_loop(tester.run())
 
 
 if __name__ == "__main__":